@@ -4,6 +4,7 @@ from google.api_core.exceptions import (
     NotFound,
 )
 
+from firestore_collections.async_collection import AsyncCollection
 from firestore_collections.collection import Collection
 from firestore_collections.enums import (
     FirestoreTimestamp,
@@ -19,6 +20,7 @@ from firestore_collections.schema import (
 
 __all__ = [
     'AlreadyExists',
+    'AsyncCollection',
     'Collection',
     'Conflict',
     'FirestoreTimestamp',
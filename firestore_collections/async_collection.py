@@ -0,0 +1,879 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, List, Union, Tuple, Optional, Dict, TypeVar
+
+from bson import ObjectId
+from google.api_core.exceptions import Aborted, AlreadyExists, NotFound, Conflict
+from google.cloud.firestore import SERVER_TIMESTAMP, AsyncClient
+from google.cloud.firestore_v1.base_document import DocumentSnapshot
+from google.cloud.firestore_v1.base_query import FieldFilter
+from pydantic import BaseModel
+
+from firestore_collections.collection import ALLOWED_MIXED_OPERATORS, Collection
+from firestore_collections.enums import OrderByDirection
+from firestore_collections.utils import (
+    chunks,
+    parse_attributes_to_dict,
+    parse_document_to_dict,
+)
+
+
+T = TypeVar("T")
+
+
+async def _commit_with_retry(write_batch, attempts: int = 3):
+    # Contended batch commits can be aborted by the server; retrying
+    # is safe because a failed commit applies none of its writes
+    for attempt in range(attempts):
+        try:
+            return await write_batch.commit()
+        except Aborted:
+            if attempt == attempts - 1:
+                raise
+            await asyncio.sleep(0.1 * 2 ** attempt)
+
+
+class AsyncCollection(Collection[T]):
+    # Async variant of `Collection` backed by the Firestore
+    # `AsyncClient`. Shares all schema parsing and validation logic
+    # with `Collection` but performs every read and write as a
+    # coroutine so independent operations can be fanned out with
+    # e.g. `asyncio.gather`.
+
+    def __init__(
+        self,
+        schema: BaseModel,
+        firestore_client: Optional[AsyncClient] = None,
+        force_ownership: Optional[bool] = False,
+        trust_server_data: Optional[bool] = False,
+        probe_cache_ttl: Optional[float] = None,
+    ):
+        if firestore_client is None:
+            from firestore_collections.client import get_async_client
+
+            firestore_client = get_async_client()
+
+        super().__init__(
+            schema=schema,
+            firestore_client=firestore_client,
+            force_ownership=force_ownership,
+            trust_server_data=trust_server_data,
+            probe_cache_ttl=probe_cache_ttl,
+        )
+
+    async def get(
+        self,
+        id: str,
+        include_attributes: Optional[List[str]] = None,
+        return_attribute: Optional[str] = None,
+        validate: Optional[bool] = True,
+    ) -> T:
+        if include_attributes is not None and return_attribute is not None:
+            raise KeyError(
+                f"Cannot provide both `include_attributes` and `return_attribute`"
+            )
+        if return_attribute is not None:
+            include_attributes = [return_attribute]
+        if include_attributes is not None:
+            if any(
+                (not self.has_attribute(attribute) for attribute in include_attributes)
+            ):
+                raise KeyError("Invalid attribute provided: `{attribute}`")
+
+        doc_ref = self.collection.document(id)
+        doc = await doc_ref.get(field_paths=include_attributes)
+
+        if not doc.exists:
+            raise NotFound(f"Document {self.collection_name}.{id} could not be found")
+
+        if return_attribute is not None:
+            return doc.get(return_attribute)
+
+        return self._to_model(doc, validate=validate)
+
+    async def get_many(self, ids: List[str]) -> List[T]:
+        # Fetch multiple documents by id using a single batched read
+        # RPC per 500 ids instead of one round-trip per id.
+        # Documents that do not exist are skipped.
+        docs = []
+        document = self.collection.document
+        for ids_chunk in chunks(ids, n=500):
+            refs = [document(id) for id in ids_chunk]
+            async for doc in self._client.get_all(refs):
+                if doc.exists:
+                    docs.append(self._to_model(doc))
+        return docs
+
+    async def get_all(
+        self,
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
+    ) -> List[T]:
+        return await self._query(
+            conditions=[], limit=limit, order_by=order_by, validate=validate
+        )
+
+    async def iter_all(
+        self,
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
+    ) -> AsyncIterator[T]:
+        # Iterator variant of `get_all` which yields documents
+        # one at a time instead of materializing the full result
+        async for doc in self._query_iter(
+            conditions=[], limit=limit, order_by=order_by, validate=validate
+        ):
+            yield doc
+
+    async def paginate(
+        self,
+        conditions: Optional[List[Tuple[str, str, Any]]] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        page_size: Optional[int] = 500,
+        start_after: Optional[DocumentSnapshot] = None,
+    ) -> Tuple[List[T], Optional[DocumentSnapshot]]:
+        # Fetch a single page of documents using a Firestore query
+        # cursor. Returns the page together with the last raw snapshot
+        # which can be passed as `start_after` to resume after the
+        # page without re-reading earlier pages.
+        if page_size <= 0:
+            raise ValueError("`page_size` must be larger than 0")
+
+        # Parse condition values based on attribute type
+        conditions = self._parse_conditions(conditions)
+
+        if any((x[1].lower() == "in" for x in conditions)):
+            raise ValueError("The `in` operator is not supported for pagination")
+
+        # Init docs object
+        docs = self.collection
+
+        # Add conditions (where clauses)
+        for condition in conditions:
+            attribute, operator, value = condition
+            docs = docs.where(filter=FieldFilter(attribute, operator, value))
+
+        # Firestore cursors require at least one ordering
+        if order_by:
+            order_by = self._parse_order_by(order_by)
+            for order_by_tuple in order_by:
+                attribute, direction_enum = order_by_tuple
+                docs = docs.order_by(attribute, direction=direction_enum.value)
+        else:
+            docs = docs.order_by("__name__")
+
+        if start_after is not None:
+            docs = docs.start_after(start_after)
+
+        docs = docs.limit(page_size)
+
+        snapshots = [doc async for doc in docs.stream()]
+        page = [self._to_model(doc) for doc in snapshots]
+        last_snapshot = snapshots[-1] if len(snapshots) > 0 else None
+
+        return page, last_snapshot
+
+    async def get_by_attribute(self, attribute: str, value: Any) -> T:
+        docs = await self.query_by_attribute(
+            attribute=attribute, value=value, limit=2
+        )
+        if len(docs) == 0:
+            raise NotFound(
+                f"Document could not be found in {self.collection_name} with `{attribute}=={value}`"
+            )
+        elif len(docs) > 1:
+            raise NotFound(
+                f"Founder more than one document in {self.collection_name} with `{attribute}=={value}`"
+            )
+
+        return docs[0]
+
+    async def _query(
+        self,
+        conditions: List[Tuple[str, str, Any]],
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
+    ) -> List[T]:
+        return [
+            doc
+            async for doc in self._query_iter(
+                conditions=conditions,
+                limit=limit,
+                order_by=order_by,
+                validate=validate,
+            )
+        ]
+
+    async def _query_iter(
+        self,
+        conditions: List[Tuple[str, str, Any]],
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
+    ) -> AsyncIterator[T]:
+        # Fast path for the plain "get all" case — no conditions to
+        # parse, no operators to classify and no query to build
+        if not conditions and not order_by and limit is None:
+            async for doc in self.collection.stream():
+                yield self._to_model(doc, validate=validate)
+            return
+
+        # Parse condition values based on attribute type
+        conditions = self._parse_conditions(conditions)
+
+        # Parse order by values
+        order_by = self._parse_order_by(order_by)
+
+        # Fast path for the common single-condition query — there is
+        # no operator mix to validate
+        if len(conditions) == 1 and conditions[0][1].lower() == "in":
+            attribute, _, values = conditions[0]
+            docs = await self._query_in(
+                attribute=attribute,
+                values=values,
+                limit=limit,
+                order_by=order_by,
+                validate=validate,
+            )
+            for doc in docs:
+                yield doc
+            return
+
+        if len(conditions) > 1:
+            # Sanity checks — classify operators in a single pass
+            in_operator_idx = -1
+            unique_operators = set()
+            has_disallowed_mix = False
+            for i, condition in enumerate(conditions):
+                operator = condition[1].lower()
+                unique_operators.add(operator)
+                if operator not in ALLOWED_MIXED_OPERATORS:
+                    has_disallowed_mix = True
+                if operator == "in":
+                    if in_operator_idx >= 0:
+                        raise ValueError(
+                            "Cannot use more than one `in` operator in conditions"
+                        )
+                    in_operator_idx = i
+
+            if in_operator_idx >= 0:
+                in_condition = conditions.pop(in_operator_idx)
+                attribute, _, values = in_condition
+                docs = await self._query_in(
+                    attribute=attribute,
+                    values=values,
+                    limit=limit,
+                    additional_attributes=[x[0] for x in conditions],
+                    additional_values=[x[2] for x in conditions],
+                    additional_operator=[x[1] for x in conditions],
+                    order_by=order_by,
+                    validate=validate,
+                )
+                for doc in docs:
+                    yield doc
+                return
+
+            if len(unique_operators) > 1 and has_disallowed_mix:
+                raise ValueError(
+                    f"Only following operators can be mixed: {set(ALLOWED_MIXED_OPERATORS)}"
+                )
+
+        # Init docs object
+        docs = self.collection
+
+        # Add conditions (where clauses)
+        for condition in conditions:
+            attribute, operator, value = condition
+            docs = docs.where(filter=FieldFilter(attribute, operator, value))
+
+        # Order by if provided
+        for order_by_tuple in order_by:
+            attribute, direction_enum = order_by_tuple
+            docs = docs.order_by(attribute, direction=direction_enum.value)
+
+        # Limit result if provided
+        if limit is not None:
+            docs = docs.limit(limit)
+
+        async for doc in docs.stream():
+            yield self._to_model(doc, validate=validate)
+
+    async def _query_in(
+        self,
+        attribute: str,
+        values: Any,
+        additional_attributes: Optional[List[str]] = None,
+        additional_values: Optional[List[Any]] = None,
+        additional_operator: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
+    ) -> List[T]:
+        # Empty sentinels — avoids allocating fresh lists per call
+        additional_attributes = additional_attributes or ()
+        additional_values = additional_values or ()
+        additional_operator = additional_operator or ()
+        order_by = order_by or ()
+
+        # Dedupe values while preserving order — duplicates would
+        # waste slots out of the 10-value `in` limit
+        values = list(dict.fromkeys(values))
+
+        # Split values up in N lists of max 10
+        # since Firestore limits the `in` operator
+        # to max 10 values
+        values_lists = chunks(values, n=10)
+
+        if len(values_lists) > 100:
+            raise ValueError("Too many values provided for `in` query")
+
+        if len(additional_attributes) != len(additional_values):
+            raise ValueError(
+                "Size of `additional_attributes` and `additional_values` must match"
+            )
+        if len(additional_values) != len(additional_operator):
+            raise ValueError(
+                "Size of `additional_values` and `additional_operator` must match"
+            )
+
+        # Resolve the (memoized) reference once for all chunk queries
+        collection = self.collection
+
+        async def _run_chunk(values: List[Any]) -> List[T]:
+            # Init docs object
+            docs = collection
+
+            # Add conditions (where clauses)
+            docs = docs.where(filter=FieldFilter(attribute, "in", values))
+
+            for _attribute, _value, _operator in zip(
+                additional_attributes,
+                additional_values,
+                additional_operator,
+            ):
+                docs = docs.where(filter=FieldFilter(_attribute, _operator, _value))
+
+            # Order by if provided
+            for order_by_tuple in order_by:
+                _attribute, direction_enum = order_by_tuple
+                docs = docs.order_by(_attribute, direction=direction_enum.value)
+
+            # Limit result if provided
+            if limit is not None:
+                docs = docs.limit(limit)
+
+            return [
+                self._to_model(doc, validate=validate)
+                async for doc in docs.stream()
+            ]
+
+        if len(values_lists) == 1:
+            return await _run_chunk(values_lists[0])
+
+        # Fan the chunk queries out concurrently
+        results = await asyncio.gather(
+            *(_run_chunk(values) for values in values_lists)
+        )
+
+        if len(order_by) > 0:
+            # Each chunk result is sorted by the server — merge and
+            # trim to the requested limit like the sync collection
+            docs_all = self._merge_ordered(results=results, order_by=order_by)
+            docs_all = self._dedupe_docs(docs_all)
+            if limit is not None:
+                docs_all = docs_all[:limit]
+            return docs_all
+
+        return self._dedupe_docs([doc for docs in results for doc in docs])
+
+    async def query_by_attribute(
+        self,
+        attribute: str,
+        value: Any,
+        operator: Optional[str] = "==",
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
+    ) -> List[T]:
+        return await self._query(
+            conditions=[(attribute, operator, value)],
+            limit=limit,
+            order_by=order_by,
+            validate=validate,
+        )
+
+    async def iter_query_by_attribute(
+        self,
+        attribute: str,
+        value: Any,
+        operator: Optional[str] = "==",
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
+    ) -> AsyncIterator[T]:
+        # Iterator variant of `query_by_attribute` which yields
+        # documents one at a time — preferable for large result sets
+        async for doc in self._query_iter(
+            conditions=[(attribute, operator, value)],
+            limit=limit,
+            order_by=order_by,
+            validate=validate,
+        ):
+            yield doc
+
+    async def query_by_attributes(
+        self,
+        attributes: List[str],
+        values: List[Any],
+        operators: List[str],
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
+    ) -> List[T]:
+        if len(attributes) != len(values):
+            raise ValueError("Number af attributes and values provided must be equal")
+
+        return await self._query(
+            conditions=[
+                (attribute, operator, value)
+                for attribute, operator, value in zip(attributes, operators, values)
+            ],
+            limit=limit,
+            order_by=order_by,
+            validate=validate,
+        )
+
+    async def query_by_any(
+        self,
+        conditions: List[Tuple[str, str, Any]],
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+    ) -> List[T]:
+        # Query documents matching any of the provided conditions
+        # using a single composite OR query
+        docs = self._build_query_any(
+            conditions=conditions, limit=limit, order_by=order_by
+        )
+        return [
+            self._to_model(doc)
+            async for doc in docs.stream()
+        ]
+
+    async def update(
+        self,
+        doc: Union[BaseModel, dict],
+        owner: Optional[str] = None,
+        force: Optional[bool] = False,
+        dry_run: Optional[bool] = False,
+        check_restrictions: Optional[bool] = True,
+        validate: Optional[bool] = True,
+    ) -> None:
+        doc = self._prepare_doc(
+            doc=doc, owner=owner, force=force, is_update=True, validate=validate
+        )
+
+        # Check for any restrictions
+        if check_restrictions:
+            await self._check_restrictions(doc=doc, is_update=True)
+
+        self._invalidate_probes(doc)
+
+        # Convert from schema to dictionary
+        doc_id = doc.id
+        doc = parse_document_to_dict(doc=doc)
+
+        if dry_run:
+            return doc
+
+        if self.is_updatable:
+            # Let the server stamp the update time
+            doc["updated_at"] = SERVER_TIMESTAMP
+
+        # Get document reference
+        doc_ref = self.collection.document(doc_id)
+
+        # `update` sends only the provided field paths instead of a
+        # full-document merge and fails if the document is missing
+        await doc_ref.update(doc)
+
+    async def update_attribute(
+        self,
+        doc_id: str,
+        attribute: str,
+        value: Any,
+        owner: Optional[str] = None,
+        force: Optional[bool] = False,
+    ) -> None:
+        return await self.update_attributes(
+            doc_id=doc_id, attributes={attribute: value}, owner=owner, force=force
+        )
+
+    async def update_attributes(
+        self,
+        doc_id: str,
+        attributes: Dict[str, Any],
+        owner: Optional[str] = None,
+        force: Optional[bool] = False,
+    ) -> None:
+        if doc_id is None:
+            raise ValueError(f"Invalid `doc_id` provided: {doc_id}")
+
+        # Check if valid attribute keys provided
+        for key in attributes.keys():
+            if not self.has_attribute(attribute=key):
+                raise KeyError("Invalid attribute provided: `{key}`")
+
+        # Check for any restrictions
+        await self._check_restrictions_attributes(doc_id=doc_id, attributes=attributes)
+
+        # Set updated date using the server-side timestamp
+        doc = attributes
+        if self.is_updatable:
+            doc["updated_at"] = SERVER_TIMESTAMP
+
+        if self.requires_owner_update:
+            if not force and (owner is None and self.force_ownership):
+                raise ValueError(
+                    f"An `owner` must be defined for collection {self.name}"
+                )
+            doc["updated_by"] = owner
+
+        # Parse values
+        doc = parse_attributes_to_dict(attributes=doc)
+
+        # Get document reference
+        doc_ref = self.collection.document(doc_id)
+
+        await doc_ref.update(doc)
+
+    async def insert(
+        self,
+        doc: Union[BaseModel, dict],
+        owner: Optional[str] = None,
+        force: Optional[bool] = False,
+        dry_run: Optional[bool] = False,
+        check_restrictions: Optional[bool] = True,
+        validate: Optional[bool] = True,
+    ) -> T:
+        model = self._prepare_doc(
+            doc=doc, owner=owner, force=force, is_update=False, validate=validate
+        )
+
+        # Check for any restrictions
+        if check_restrictions:
+            await self._check_restrictions(doc=model, is_update=False)
+
+        self._invalidate_probes(model)
+
+        # Convert from schema to dictionary
+        doc = parse_document_to_dict(doc=model)
+
+        if dry_run:
+            return doc
+
+        # Let the server stamp the creation time
+        doc["created_at"] = SERVER_TIMESTAMP
+
+        # Insert new document
+        new_id = doc.pop("id", None)
+        if new_id is None:
+            new_id = str(ObjectId())
+        doc_ref = self.collection.document(new_id)
+        try:
+            await doc_ref.create(doc)
+        except AlreadyExists:
+            raise Conflict(
+                f"Document {self.collection_name}.{new_id} already exists"
+            )
+
+        return model.copy(update={"id": new_id})
+
+    async def bulk_insert(
+        self,
+        docs: List[Union[BaseModel, dict]],
+        owner: Optional[str] = None,
+        force: Optional[bool] = False,
+        batch_size: Optional[int] = 500,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("`batch_size` must be larger than 0")
+        if batch_size > 500:
+            # Firestore limits a single batched write to 500 operations
+            raise ValueError("`batch_size` cannot exceed 500")
+        if len(docs) == 0:
+            raise ValueError("No documents provided")
+
+        if self._probe_cache is not None:
+            self._probe_cache.clear()
+
+        # Check restrictions for all docs using batched queries
+        await self._check_restrictions_bulk(docs=docs, is_update=False)
+
+        # Parse all docs to dicts without going through `insert`
+        docs = [
+            parse_document_to_dict(
+                doc=self._prepare_doc(doc=doc, owner=owner, force=force)
+            )
+            for doc in docs
+        ]
+
+        for docs_chunk in chunks(docs, n=batch_size):
+            write_batch = self._client.batch()
+            for doc in docs_chunk:
+                doc_id = doc.pop("id", None)
+                if doc_id is None:
+                    doc_id = str(ObjectId())
+                write_batch.create(
+                    reference=self.collection.document(doc_id), document_data=doc
+                )
+            await _commit_with_retry(write_batch)
+
+    async def bulk_update(
+        self,
+        docs: List[Union[BaseModel, dict]],
+        owner: Optional[str] = None,
+        force: Optional[bool] = False,
+        merge: Optional[bool] = False,
+        batch_size: Optional[int] = 500,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("`batch_size` must be larger than 0")
+        if batch_size > 500:
+            # Firestore limits a single batched write to 500 operations
+            raise ValueError("`batch_size` cannot exceed 500")
+        if len(docs) == 0:
+            raise ValueError("No documents provided")
+
+        if self._probe_cache is not None:
+            self._probe_cache.clear()
+
+        # Check restrictions for all docs using batched queries
+        await self._check_restrictions_bulk(docs=docs, is_update=True)
+
+        # Parse all docs to dicts without going through `update`
+        docs = [
+            parse_document_to_dict(
+                doc=self._prepare_doc(doc=doc, owner=owner, force=force, is_update=True)
+            )
+            for doc in docs
+        ]
+
+        for docs_chunk in chunks(docs, n=batch_size):
+            write_batch = self._client.batch()
+            for doc in docs_chunk:
+                doc_id = doc.pop("id", None)
+                if doc_id is None:
+                    doc_id = str(ObjectId())
+                write_batch.set(
+                    reference=self.collection.document(doc_id),
+                    document_data=doc,
+                    merge=merge,
+                )
+            await _commit_with_retry(write_batch)
+
+    async def delete(
+        self, id: str, owner: Optional[str] = None, force: Optional[bool] = False
+    ) -> None:
+        if self._probe_cache is not None:
+            # The deleted values are unknown here — drop everything
+            self._probe_cache.clear()
+
+        # Set updated by and time before deleting to trigger change
+        if self._is_owner_schema:
+            if not force and (owner is None and self.force_ownership):
+                raise ValueError(
+                    f"An `owner` must be defined for collection {self.name}"
+                )
+
+            if owner is not None:
+                # Commit the tombstone and the delete as a single
+                # batched write instead of two round-trips
+                doc_ref = self.collection.document(id)
+                write_batch = self._client.batch()
+                if self.is_updatable:
+                    write_batch.set(
+                        reference=doc_ref,
+                        document_data={
+                            "updated_at": SERVER_TIMESTAMP,
+                            "updated_by": owner,
+                            "deleted": True,
+                        },
+                        merge=True,
+                    )
+                else:
+                    write_batch.set(
+                        reference=doc_ref,
+                        document_data={
+                            "deleted": True,
+                        },
+                        merge=True,
+                    )
+                write_batch.delete(reference=doc_ref)
+                await _commit_with_retry(write_batch)
+                return
+
+        await self.collection.document(id).delete()
+
+    async def bulk_delete(
+        self,
+        doc_ids: List[str],
+        owner: Optional[str] = None,
+        force: Optional[bool] = False,
+        batch_size: Optional[int] = 500,
+    ) -> None:
+        if batch_size <= 0:
+            raise ValueError("`batch_size` must be larger than 0")
+        if batch_size > 500:
+            # Firestore limits a single batched write to 500 operations
+            raise ValueError("`batch_size` cannot exceed 500")
+        if len(doc_ids) == 0:
+            raise ValueError("No document IDs provided")
+
+        if self._probe_cache is not None:
+            self._probe_cache.clear()
+
+        # Set updated by and time before deleting to trigger change
+        update_before_delete = False
+        if self._is_owner_schema:
+            if not force and (owner is None and self.force_ownership):
+                raise ValueError(
+                    f"An `owner` must be defined for collection {self.name}"
+                )
+
+            if owner is not None:
+                update_before_delete = True
+
+        if update_before_delete:
+            batch_size = max(1, batch_size // 2)
+
+        for ids_chunk in chunks(doc_ids, n=batch_size):
+            write_batch = self._client.batch()
+            now = datetime.now(timezone.utc)
+            for doc_id in ids_chunk:
+                doc_ref = self.collection.document(doc_id)
+                if update_before_delete:
+                    if self.is_updatable:
+                        write_batch.set(
+                            reference=doc_ref,
+                            document_data={
+                                "updated_at": now,
+                                "updated_by": owner,
+                                "deleted": True,
+                            },
+                            merge=True,
+                        )
+                    else:
+                        write_batch.set(
+                            reference=doc_ref,
+                            document_data={
+                                "deleted": True,
+                            },
+                            merge=True,
+                        )
+                write_batch.delete(reference=doc_ref)
+            await _commit_with_retry(write_batch)
+
+    async def _probe_unique(self, key: str, value: Any) -> Optional[str]:
+        # Cheapest possible existence probe: at most one result and
+        # only the document name on the wire
+        if self._probe_cache is not None:
+            existing_id = self._probe_cache.get((key, value))
+            if existing_id is not None:
+                return existing_id
+
+        docs = (
+            self.collection.where(filter=FieldFilter(key, "==", value))
+            .limit(1)
+            .select(["__name__"])
+            .stream()
+        )
+        async for doc in docs:
+            if self._probe_cache is not None:
+                self._probe_cache.set((key, value), doc.id)
+            return doc.id
+        return None
+
+    async def _check_restrictions(self, doc: BaseModel, is_update: bool = False):
+        # Check for any restrictions
+        for key in self.get_unique_keys():
+            value = getattr(doc, key)
+            if value is None:
+                # Unset unique keys cannot clash
+                continue
+
+            existing_id = await self._probe_unique(key=key, value=value)
+
+            if existing_id is None:
+                # No document with given unique key found
+                continue
+
+            # If the clashing document is itself then allow clash
+            if is_update and doc.id == existing_id:
+                continue
+
+            raise Conflict(f"{self.name} with {key} {value} already exists")
+
+    async def _check_restrictions_bulk(
+        self,
+        docs: List[Union[BaseModel, dict]],
+        is_update: bool = False,
+    ):
+        # Check restrictions for all documents at once using `in`
+        # queries instead of issuing one query per document
+        for key in self.get_unique_keys():
+            doc_ids = {}
+            for doc in docs:
+                if isinstance(doc, dict):
+                    value = doc.get(key)
+                    doc_id = doc.get("id")
+                else:
+                    value = getattr(doc, key)
+                    doc_id = doc.id
+
+                if value is None:
+                    # Unset unique keys cannot clash
+                    continue
+
+                doc_ids[value] = doc_id
+
+            # Dedupe values while preserving order
+            values = list(doc_ids.keys())
+
+            # `_query_in` supports at most 100 chunks of 10 values
+            # so query in groups of max 1000 values
+            for values_chunk in chunks(values, n=1000):
+                for doc_db in await self._query_in(
+                    attribute=key, values=values_chunk
+                ):
+                    value = getattr(doc_db, key)
+
+                    # If the clashing document is itself then allow clash
+                    if is_update and doc_ids.get(value) == doc_db.id:
+                        continue
+
+                    raise Conflict(f"{self.name} with {key} {value} already exists")
+
+    async def _check_restrictions_attributes(
+        self, doc_id: str, attributes: Dict[str, Any]
+    ):
+        # Check for any restrictions
+        for key in self.get_unique_keys():
+            if key not in attributes:
+                continue
+            value = attributes.get(key)
+            docs_db = await self.query_by_attribute(
+                attribute=key, value=value, limit=1
+            )
+
+            if len(docs_db) == 0:
+                # No document with given unique key found
+                continue
+
+            # If the clashing document is itself then allow clash
+            if doc_id == docs_db[0].id:
+                continue
+
+            raise Conflict(f"{self.name} with {key} {value} already exists")
@@ -1,5 +1,31 @@
 import os
+import threading
 
-from google.cloud.firestore import Client
+from google.cloud.firestore import AsyncClient, Client
 
-client = Client(project=os.getenv('PROJECT_ID'))
+# A single client per process is shared across all collections by
+# default. Under highly concurrent load a single gRPC channel can
+# become a serialization point, so a small pool of clients can be
+# enabled with `FIRESTORE_CLIENT_POOL_SIZE` which is round-robined
+# by thread id.
+pool_size = max(1, int(os.getenv('FIRESTORE_CLIENT_POOL_SIZE', '1')))
+
+_clients = [Client(project=os.getenv('PROJECT_ID')) for _ in range(pool_size)]
+
+client = _clients[0]
+
+
+def get_client() -> Client:
+    return _clients[threading.get_ident() % pool_size]
+
+
+# The async client is created lazily since most applications only
+# use the synchronous API
+_async_client = None
+
+
+def get_async_client() -> AsyncClient:
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncClient(project=os.getenv('PROJECT_ID'))
+    return _async_client
@@ -1,18 +1,24 @@
-from collections import Counter
+import heapq
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, List, Union, Tuple, Optional, Dict, TypeVar, Generic
+from itertools import chain
+from functools import lru_cache
+from typing import Any, Iterator, List, NamedTuple, Union, Tuple, Optional, Dict, TypeVar, Generic
 
 from bson import ObjectId
 from google.api_core.datetime_helpers import DatetimeWithNanoseconds
-from google.api_core.exceptions import NotFound, Conflict
-from google.cloud.firestore_v1.batch import WriteBatch
+from google.api_core.exceptions import Aborted, AlreadyExists, NotFound, Conflict
+from google.cloud.firestore_v1.base_document import DocumentSnapshot
+from google.cloud.firestore_v1.base_query import FieldFilter, Or
 from google.cloud.firestore_v1.collection import CollectionReference
-from google.cloud.firestore import Client
+from google.cloud.firestore import SERVER_TIMESTAMP, Client
 from pydantic import BaseModel
 
 from firestore_collections.enums import OrderByDirection
 from firestore_collections.schema import StaticSchemaWithOwner, SchemaWithOwner
 from firestore_collections.utils import (
+    TTLCache,
     chunks,
     parse_attributes_to_dict,
     parse_document_to_dict,
@@ -21,6 +27,65 @@ from firestore_collections.utils import (
 
 T = TypeVar("T")
 
+# Operators which may be combined in a single query
+ALLOWED_MIXED_OPERATORS = frozenset({">=", "<=", "==", "!=", ">", "<", "in"})
+
+
+def _commit_with_retry(write_batch, attempts: int = 3):
+    # Contended batch commits can be aborted by the server; retrying
+    # is safe because a failed commit applies none of its writes
+    for attempt in range(attempts):
+        try:
+            return write_batch.commit()
+        except Aborted:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.1 * 2 ** attempt)
+
+
+class _SchemaMeta(NamedTuple):
+    schema_props: Optional[Dict[str, Any]]
+    is_updatable: bool
+    requires_owner_insert: bool
+    requires_owner_update: bool
+    is_owner_schema: bool
+    unique_keys: Tuple[str, ...]
+    datetime_attrs: frozenset
+
+
+@lru_cache(maxsize=None)
+def _get_schema_meta(schema_cls: type) -> _SchemaMeta:
+    # Walking the pydantic schema graph is expensive, and the result
+    # only depends on the schema class — compute it exactly once per
+    # class no matter how many `Collection` instances are created
+    if issubclass(schema_cls, BaseModel):
+        schema_props = schema_cls.schema().get("properties", {})
+        is_updatable = "updated_at" in schema_props
+    else:
+        schema_props = None
+        is_updatable = True
+
+    # Attributes holding datetimes, so condition values can be parsed
+    # with one set lookup instead of re-scanning the JSON schema
+    datetime_attrs = frozenset(
+        attribute
+        for attribute, props in (schema_props or {}).items()
+        if props.get("format") == "date-time"
+        or any(x.get("format") == "date-time" for x in props.get("anyOf", []))
+    )
+
+    return _SchemaMeta(
+        schema_props=schema_props,
+        is_updatable=is_updatable,
+        requires_owner_insert=issubclass(
+            schema_cls, (SchemaWithOwner, StaticSchemaWithOwner)
+        ),
+        requires_owner_update=issubclass(schema_cls, SchemaWithOwner),
+        is_owner_schema=issubclass(schema_cls, SchemaWithOwner),
+        unique_keys=tuple(getattr(schema_cls, "__unique_keys__", [])),
+        datetime_attrs=datetime_attrs,
+    )
+
 
 class Collection(Generic[T]):
     is_updatable = True
@@ -30,27 +95,59 @@ class Collection(Generic[T]):
         schema: BaseModel,
         firestore_client: Optional[Client] = None,
         force_ownership: Optional[bool] = False,
+        cache_size: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+        trust_server_data: Optional[bool] = False,
+        probe_cache_ttl: Optional[float] = None,
     ):
         self.schema = schema
         self.collection_name = schema.__collection_name__
         self.force_ownership = force_ownership
+        self._collection_ref = None
+
+        # When enabled, documents read back from Firestore are built
+        # with `construct` instead of full pydantic validation — the
+        # data was validated on its way in, so re-validating every
+        # result is mostly redundant CPU work. Off by default since
+        # it also skips defaults for fields missing in old documents.
+        self._trust_server_data = trust_server_data
+
+        # Optional in-process cache for documents fetched with `get`.
+        # Entries are invalidated on writes through this collection
+        # instance, but writes from other processes are not seen
+        # until the TTL expires.
+        if cache_size is not None:
+            self._cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        else:
+            self._cache = None
+
+        # Optional short-lived cache for unique-key probes, keyed on
+        # (key, value). Only positive probes are cached — a miss must
+        # always hit the server or a conflicting insert could slip
+        # through between expiries.
+        if probe_cache_ttl is not None:
+            self._probe_cache = TTLCache(maxsize=1024, ttl=probe_cache_ttl)
+        else:
+            self._probe_cache = None
 
         if self.collection_name is None:
             raise ValueError("`__collection_name__` has not been defined")
 
         if firestore_client is None:
-            from firestore_collections.client import client
+            from firestore_collections.client import get_client
 
-            self._client = client
+            self._client = get_client()
         else:
             self._client = firestore_client
 
-        if issubclass(self.schema, BaseModel):
-            schema_pydantic = self.schema.schema()
-            self.schema_props = schema_pydantic.get("properties", {})
-            self.is_updatable = self.has_attribute(attribute="updated_at")
-        else:
-            self.schema_props = None
+        # All schema-derived properties and ownership flags are
+        # computed once per schema class and shared across instances
+        self._meta = _get_schema_meta(self.schema)
+        self.schema_props = self._meta.schema_props
+        self.is_updatable = self._meta.is_updatable
+        self._requires_owner_insert = self._meta.requires_owner_insert
+        self._requires_owner_update = self._meta.requires_owner_update
+        self._is_owner_schema = self._meta.is_owner_schema
 
     @property
     def name(self) -> str:
@@ -62,17 +159,14 @@ class Collection(Generic[T]):
 
     @property
     def requires_owner_insert(self) -> bool:
-        return (
-            self.schema.__mro__[1] == SchemaWithOwner
-            or self.schema.__mro__[1] == StaticSchemaWithOwner
-        )
+        return self._requires_owner_insert
 
     @property
     def requires_owner_update(self) -> bool:
-        return self.schema.__mro__[1] == SchemaWithOwner
+        return self._requires_owner_update
 
     def get_unique_keys(self) -> List[str]:
-        return getattr(self.schema, "__unique_keys__", [])
+        return list(self._meta.unique_keys)
 
     def has_attribute(self, attribute: str) -> bool:
         if self.schema_props is not None:
@@ -81,13 +175,18 @@ class Collection(Generic[T]):
 
     @property
     def collection(self) -> CollectionReference:
-        return self._client.collection(self.collection_name)
+        # Memoized since the reference is immutable and the property
+        # is accessed multiple times per operation
+        if self._collection_ref is None:
+            self._collection_ref = self._client.collection(self.collection_name)
+        return self._collection_ref
 
     def get(
         self,
         id: str,
         include_attributes: Optional[List[str]] = None,
         return_attribute: Optional[str] = None,
+        validate: Optional[bool] = True,
     ) -> T:
         if include_attributes is not None and return_attribute is not None:
             raise KeyError(
@@ -101,6 +200,12 @@ class Collection(Generic[T]):
             ):
                 raise KeyError("Invalid attribute provided: `{attribute}`")
 
+        use_cache = self._cache is not None and include_attributes is None
+        if use_cache:
+            doc_cached = self._cache.get(id)
+            if doc_cached is not None:
+                return doc_cached
+
         doc_ref = self.collection.document(id)
         doc = doc_ref.get(field_paths=include_attributes)
 
@@ -110,17 +215,111 @@ class Collection(Generic[T]):
         if return_attribute is not None:
             return doc.get(return_attribute)
 
-        return self.schema(**{**doc.to_dict(), "id": doc.id})
+        doc = self._to_model(doc, validate=validate)
+
+        if use_cache:
+            self._cache.set(id, doc)
+
+        return doc
+
+    def get_many(self, ids: List[str]) -> List[T]:
+        # Fetch multiple documents by id using a single batched read
+        # RPC per 500 ids instead of one round-trip per id.
+        # Documents that do not exist are skipped.
+        docs = []
+        document = self.collection.document
+        for ids_chunk in chunks(ids, n=500):
+            refs = [document(id) for id in ids_chunk]
+            for doc in self._client.get_all(refs):
+                if doc.exists:
+                    docs.append(self._to_model(doc))
+        return docs
 
     def get_all(
         self,
         limit: Optional[int] = None,
-        order_by: Optional[List[Tuple[str, OrderByDirection]]] = [],
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        include_attributes: Optional[List[str]] = None,
+        validate: Optional[bool] = True,
     ) -> List[T]:
-        return self._query(conditions=[], limit=limit, order_by=order_by)
+        return self._query(
+            conditions=[],
+            limit=limit,
+            order_by=order_by,
+            include_attributes=include_attributes,
+            validate=validate,
+        )
+
+    def iter_all(
+        self,
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        include_attributes: Optional[List[str]] = None,
+        validate: Optional[bool] = True,
+    ) -> Iterator[T]:
+        # Iterator variant of `get_all` which yields documents
+        # one at a time instead of materializing the full result
+        return self._query_iter(
+            conditions=[],
+            limit=limit,
+            order_by=order_by,
+            include_attributes=include_attributes,
+            validate=validate,
+        )
+
+    def paginate(
+        self,
+        conditions: Optional[List[Tuple[str, str, Any]]] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        page_size: Optional[int] = 500,
+        start_after: Optional[DocumentSnapshot] = None,
+    ) -> Tuple[List[T], Optional[DocumentSnapshot]]:
+        # Fetch a single page of documents using a Firestore query
+        # cursor. Returns the page together with the last raw snapshot
+        # which can be passed as `start_after` to resume after the
+        # page without re-reading earlier pages.
+        if page_size <= 0:
+            raise ValueError("`page_size` must be larger than 0")
+
+        # Parse condition values based on attribute type
+        conditions = self._parse_conditions(conditions)
+
+        if any((x[1].lower() == "in" for x in conditions)):
+            raise ValueError("The `in` operator is not supported for pagination")
+
+        # Init docs object
+        docs = self.collection
+
+        # Add conditions (where clauses)
+        for condition in conditions:
+            attribute, operator, value = condition
+            docs = docs.where(filter=FieldFilter(attribute, operator, value))
+
+        # Firestore cursors require at least one ordering
+        if order_by:
+            order_by = self._parse_order_by(order_by)
+            for order_by_tuple in order_by:
+                attribute, direction_enum = order_by_tuple
+                docs = docs.order_by(attribute, direction=direction_enum.value)
+        else:
+            docs = docs.order_by("__name__")
+
+        if start_after is not None:
+            docs = docs.start_after(start_after)
+
+        docs = docs.limit(page_size)
+
+        snapshots = list(docs.stream())
+        page = [self._to_model(doc) for doc in snapshots]
+        last_snapshot = snapshots[-1] if len(snapshots) > 0 else None
+
+        return page, last_snapshot
 
     def get_by_attribute(self, attribute: str, value: Any) -> T:
-        docs = self.query_by_attribute(attribute=attribute, value=value)
+        # Limit to 2 documents since only the first is returned and
+        # a second match already means the result is ambiguous —
+        # no reason to stream the full matching set
+        docs = self.query_by_attribute(attribute=attribute, value=value, limit=2)
         if len(docs) == 0:
             raise NotFound(
                 f"Document could not be found in {self.collection_name} with `{attribute}=={value}`"
@@ -132,46 +331,123 @@ class Collection(Generic[T]):
 
         return docs[0]
 
+    def _to_model(self, doc: DocumentSnapshot, validate: bool = True) -> T:
+        # Single place where a raw snapshot becomes a schema object.
+        # Mutating the dict returned by `to_dict` avoids building an
+        # intermediate merged dict per document.
+        data = doc.to_dict()
+        data["id"] = doc.id
+        if not validate or self._trust_server_data:
+            return self.schema.construct(**data)
+        return self.schema(**data)
+
+    def _iter_docs(self, docs, validate: bool = True) -> Iterator[T]:
+        # Yield parsed documents as the stream produces snapshots
+        # so callers can process results in constant memory
+        for doc in docs.stream():
+            yield self._to_model(doc, validate=validate)
+
     def _query(
         self,
         conditions: List[Tuple[str, str, Any]],
         limit: Optional[int] = None,
-        order_by: Optional[List[Tuple[str, OrderByDirection]]] = [],
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        include_attributes: Optional[List[str]] = None,
+        validate: Optional[bool] = True,
     ) -> List[T]:
+        return list(
+            self._query_iter(
+                conditions=conditions,
+                limit=limit,
+                order_by=order_by,
+                include_attributes=include_attributes,
+                validate=validate,
+            )
+        )
+
+    def _query_iter(
+        self,
+        conditions: List[Tuple[str, str, Any]],
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        include_attributes: Optional[List[str]] = None,
+        validate: Optional[bool] = True,
+    ) -> Iterator[T]:
+        if include_attributes is not None:
+            if any(
+                (not self.has_attribute(attribute) for attribute in include_attributes)
+            ):
+                raise KeyError(f"Invalid attribute provided: `{include_attributes}`")
+
+        # Fast path for the plain "get all" case — no conditions to
+        # parse, no operators to classify and no query to build
+        if not conditions and not order_by and limit is None and include_attributes is None:
+            yield from self._iter_docs(self.collection, validate=validate)
+            return
+
         # Parse condition values based on attribute type
         conditions = self._parse_conditions(conditions)
 
         # Parse order by values
         order_by = self._parse_order_by(order_by)
 
-        # Sanity checks
-        operators = [x[1].lower() for x in conditions]
-        operator_counts = Counter(operators)
-        unique_operators = list(operator_counts.keys())
-        in_operator_count = operator_counts.get("in", 0)
-
-        if in_operator_count > 1:
-            raise ValueError("Cannot use more than one `in` operator in conditions")
-
-        if in_operator_count == 1:
-            in_operator_idx = operators.index("in")
-            in_condition = conditions.pop(in_operator_idx)
-            attribute, _, values = in_condition
-            return self._query_in(
+        # Fast path for the common single-condition query — there is
+        # no operator mix to validate
+        if len(conditions) == 1 and conditions[0][1].lower() == "in":
+            if include_attributes is not None:
+                raise ValueError(
+                    "`include_attributes` is not supported for `in` queries"
+                )
+            attribute, _, values = conditions[0]
+            yield from self._query_in(
                 attribute=attribute,
                 values=values,
                 limit=limit,
-                additional_attributes=[x[0] for x in conditions],
-                additional_values=[x[2] for x in conditions],
-                additional_operator=[x[1] for x in conditions],
                 order_by=order_by,
+                validate=validate,
             )
+            return
+
+        if len(conditions) > 1:
+            # Sanity checks — classify operators in a single pass
+            # instead of building operator lists and counters per query
+            in_operator_idx = -1
+            unique_operators = set()
+            has_disallowed_mix = False
+            for i, condition in enumerate(conditions):
+                operator = condition[1].lower()
+                unique_operators.add(operator)
+                if operator not in ALLOWED_MIXED_OPERATORS:
+                    has_disallowed_mix = True
+                if operator == "in":
+                    if in_operator_idx >= 0:
+                        raise ValueError(
+                            "Cannot use more than one `in` operator in conditions"
+                        )
+                    in_operator_idx = i
+
+            if in_operator_idx >= 0:
+                if include_attributes is not None:
+                    raise ValueError(
+                        "`include_attributes` is not supported for `in` queries"
+                    )
+                in_condition = conditions.pop(in_operator_idx)
+                attribute, _, values = in_condition
+                yield from self._query_in(
+                    attribute=attribute,
+                    values=values,
+                    limit=limit,
+                    additional_attributes=[x[0] for x in conditions],
+                    additional_values=[x[2] for x in conditions],
+                    additional_operator=[x[1] for x in conditions],
+                    order_by=order_by,
+                    validate=validate,
+                )
+                return
 
-        if len(unique_operators) > 1:
-            allowed_mixed_operators = {">=", "<=", "==", "!=", ">", "<", "in"}
-            if len(set(unique_operators) - allowed_mixed_operators) != 0:
+            if len(unique_operators) > 1 and has_disallowed_mix:
                 raise ValueError(
-                    f"Only following operators can be mixed: {allowed_mixed_operators}"
+                    f"Only following operators can be mixed: {set(ALLOWED_MIXED_OPERATORS)}"
                 )
 
         # Init docs object
@@ -180,7 +456,7 @@ class Collection(Generic[T]):
         # Add conditions (where clauses)
         for condition in conditions:
             attribute, operator, value = condition
-            docs = docs.where(attribute, operator, value)
+            docs = docs.where(filter=FieldFilter(attribute, operator, value))
 
         # Order by if provided
         for order_by_tuple in order_by:
@@ -188,35 +464,52 @@ class Collection(Generic[T]):
             docs = docs.order_by(attribute, direction=direction_enum.value)
 
         # Limit result if provided
-        if limit:
+        if limit is not None:
             docs = docs.limit(limit)
 
-        # Create generator
-        docs = docs.stream()
+        # Only fetch the requested fields so the server sends (and the
+        # client unmarshals) a fraction of each document
+        if include_attributes is not None:
+            docs = docs.select(include_attributes)
+            yield from self._iter_docs(docs, validate=False)
+            return
 
-        return [self.schema(**{**doc.to_dict(), "id": doc.id}) for doc in docs]
+        yield from self._iter_docs(docs, validate=validate)
 
     def _query_in(
         self,
         attribute: str,
         values: Any,
-        additional_attributes: Optional[List[str]] = [],
-        additional_values: Optional[List[Any]] = [],
-        additional_operator: Optional[List[str]] = [],
+        additional_attributes: Optional[List[str]] = None,
+        additional_values: Optional[List[Any]] = None,
+        additional_operator: Optional[List[str]] = None,
         limit: Optional[int] = None,
-        order_by: Optional[List[Tuple[str, OrderByDirection]]] = [],
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
     ) -> List[T]:
+        # Empty sentinels — avoids allocating fresh lists per call
+        additional_attributes = additional_attributes or ()
+        additional_values = additional_values or ()
+        additional_operator = additional_operator or ()
+        order_by = order_by or ()
+
+        # Dedupe values while preserving order — duplicates would
+        # waste slots out of the 10-value `in` limit
+        values = list(dict.fromkeys(values))
+
         # Split values up in N lists of max 10
         # since Firestore limits the `in` operator
         # to max 10 values
-        values_lists = list(chunks(values, n=10))
+        values_lists = chunks(values, n=10)
+
+        if len(values_lists) == 0:
+            # No values can match nothing — and the executor below
+            # requires at least one worker
+            return []
 
         if len(values_lists) > 100:
             raise ValueError("Too many values provided for `in` query")
 
-        if len(order_by) > 0:
-            raise NotImplementedError("`order_by` has not been implemented yet")
-
         if len(additional_attributes) != len(additional_values):
             raise ValueError(
                 "Size of `additional_attributes` and `additional_values` must match"
@@ -226,31 +519,93 @@ class Collection(Generic[T]):
                 "Size of `additional_values` and `additional_operator` must match"
             )
 
-        docs_all = []
-        for values in values_lists:
+        # Resolve the (memoized) reference once for all chunk queries
+        collection = self.collection
+
+        def _run_chunk(values: List[Any]) -> List[T]:
             # Init docs object
-            docs = self.collection
+            docs = collection
 
             # Add conditions (where clauses)
-            docs = docs.where(attribute, "in", values)
+            docs = docs.where(filter=FieldFilter(attribute, "in", values))
 
             for _attribute, _value, _operator in zip(
                 additional_attributes,
                 additional_values,
                 additional_operator,
             ):
-                docs = docs.where(_attribute, _operator, _value)
+                docs = docs.where(filter=FieldFilter(_attribute, _operator, _value))
+
+            # Order by if provided
+            for order_by_tuple in order_by:
+                _attribute, direction_enum = order_by_tuple
+                docs = docs.order_by(_attribute, direction=direction_enum.value)
 
             # Limit result if provided
-            if limit:
+            if limit is not None:
                 docs = docs.limit(limit)
 
             # Create generator
-            docs = [
-                self.schema(**{**doc.to_dict(), "id": doc.id}) for doc in docs.stream()
-            ]
-            docs_all.extend(docs)
+            return [self._to_model(doc, validate=validate) for doc in docs.stream()]
+
+        if len(values_lists) == 1:
+            return _run_chunk(values_lists[0])
+
+        # Dispatch chunk queries concurrently since the underlying
+        # gRPC channel multiplexes concurrent requests on a
+        # single connection
+        with ThreadPoolExecutor(max_workers=min(len(values_lists), 10)) as executor:
+            results = list(executor.map(_run_chunk, values_lists))
 
+        if len(order_by) > 0:
+            docs_all = self._merge_ordered(
+                results=results, order_by=order_by
+            )
+            docs_all = self._dedupe_docs(docs_all)
+            if limit is not None:
+                docs_all = docs_all[:limit]
+            return docs_all
+
+        return self._dedupe_docs(list(chain.from_iterable(results)))
+
+    @staticmethod
+    def _dedupe_docs(docs: List[T]) -> List[T]:
+        # Defensive dedup across chunk results — the same id should
+        # only appear once in the combined result
+        seen = set()
+        docs_unique = []
+        for doc in docs:
+            if doc.id in seen:
+                continue
+            seen.add(doc.id)
+            docs_unique.append(doc)
+        return docs_unique
+
+    def _merge_ordered(
+        self,
+        results: List[List[T]],
+        order_by: List[Tuple[str, OrderByDirection]],
+    ) -> List[T]:
+        # Each chunk result is already sorted by the server, so the
+        # chunks only need to be merged instead of fully re-sorted
+        attributes = [x[0] for x in order_by]
+        directions = set((x[1] for x in order_by))
+
+        def _sort_key(doc: T) -> Tuple:
+            return tuple((getattr(doc, attribute) for attribute in attributes))
+
+        if len(directions) == 1:
+            reverse = directions == {OrderByDirection.Descending}
+            return list(heapq.merge(*results, key=_sort_key, reverse=reverse))
+
+        # Mixed sort directions cannot be heap-merged directly, so
+        # fall back to successive stable sorts over the combined list
+        docs_all = list(chain.from_iterable(results))
+        for attribute, direction_enum in reversed(order_by):
+            docs_all.sort(
+                key=lambda doc: getattr(doc, attribute),
+                reverse=direction_enum == OrderByDirection.Descending,
+            )
         return docs_all
 
     def query_by_attribute(
@@ -259,10 +614,32 @@ class Collection(Generic[T]):
         value: Any,
         operator: Optional[str] = "==",
         limit: Optional[int] = None,
-        order_by: Optional[List[Tuple[str, OrderByDirection]]] = [],
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
     ) -> List[T]:
         return self._query(
-            conditions=[(attribute, operator, value)], limit=limit, order_by=order_by
+            conditions=[(attribute, operator, value)],
+            limit=limit,
+            order_by=order_by,
+            validate=validate,
+        )
+
+    def iter_query_by_attribute(
+        self,
+        attribute: str,
+        value: Any,
+        operator: Optional[str] = "==",
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
+    ) -> Iterator[T]:
+        # Iterator variant of `query_by_attribute` which yields
+        # documents one at a time — preferable for large result sets
+        return self._query_iter(
+            conditions=[(attribute, operator, value)],
+            limit=limit,
+            order_by=order_by,
+            validate=validate,
         )
 
     def query_by_attributes(
@@ -271,7 +648,8 @@ class Collection(Generic[T]):
         values: List[Any],
         operators: List[str],
         limit: Optional[int] = None,
-        order_by: Optional[List[Tuple[str, OrderByDirection]]] = [],
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+        validate: Optional[bool] = True,
     ) -> List[T]:
         if len(attributes) != len(values):
             raise ValueError("Number af attributes and values provided must be equal")
@@ -283,37 +661,118 @@ class Collection(Generic[T]):
             ],
             limit=limit,
             order_by=order_by,
+            validate=validate,
         )
 
-    def update(
+    def query_by_any(
+        self,
+        conditions: List[Tuple[str, str, Any]],
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+    ) -> List[T]:
+        # Query documents matching any of the provided conditions
+        # using a single composite OR query instead of one query
+        # per condition
+        docs = self._build_query_any(
+            conditions=conditions, limit=limit, order_by=order_by
+        )
+        return list(self._iter_docs(docs))
+
+    def _build_query_any(
+        self,
+        conditions: List[Tuple[str, str, Any]],
+        limit: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, OrderByDirection]]] = None,
+    ):
+        if len(conditions) == 0:
+            raise ValueError("No conditions provided")
+
+        # Parse condition values based on attribute type
+        conditions = self._parse_conditions(conditions)
+
+        # Parse order by values
+        order_by = self._parse_order_by(order_by)
+
+        docs = self.collection.where(
+            filter=Or([FieldFilter(*condition) for condition in conditions])
+        )
+
+        # Order by if provided
+        for order_by_tuple in order_by:
+            attribute, direction_enum = order_by_tuple
+            docs = docs.order_by(attribute, direction=direction_enum.value)
+
+        # Limit result if provided
+        if limit is not None:
+            docs = docs.limit(limit)
+
+        return docs
+
+    def _prepare_doc(
         self,
         doc: Union[BaseModel, dict],
         owner: Optional[str] = None,
         force: Optional[bool] = False,
-        dry_run: Optional[bool] = False,
-    ) -> None:
+        is_update: bool = False,
+        validate: bool = True,
+    ) -> T:
+        # Pure CPU-side validation and preparation shared by the
+        # single and bulk write paths — performs no Firestore I/O
         if isinstance(doc, BaseModel) and not isinstance(doc, self.schema):
             raise ValueError(f"Invalid schema used for provided document: {doc}")
 
         if isinstance(doc, dict):
-            doc = self.schema(doc)
+            if validate:
+                doc = self.schema(**doc)
+            else:
+                # Skip pydantic validation for trusted input
+                doc = self.schema.construct(**doc)
+
+        if is_update:
+            if doc.id is None:
+                raise ValueError(f"Provided document has not id: {doc}")
+
+            if self.is_updatable:
+                # Set updated date
+                doc.updated_at = datetime.now(timezone.utc)
+
+            if self.requires_owner_update:
+                if not force and (owner is None and self.force_ownership):
+                    raise ValueError(
+                        f"An `owner` must be defined for collection {self.name}"
+                    )
+                doc.updated_by = owner
+        else:
+            # Set created date
+            doc.created_at = datetime.now(timezone.utc)
 
-        if doc.id is None:
-            raise ValueError(f"Provided document has not id: {doc}")
+            if self.requires_owner_insert:
+                if not force and (owner is None and self.force_ownership):
+                    raise ValueError(
+                        f"An `owner` must be defined for collection {self.name}"
+                    )
+                doc.created_by = owner
 
-        # Check for any restrictions
-        self._check_restrictions(doc=doc, is_update=True)
+        return doc
 
-        if self.is_updatable:
-            # Set updated date
-            doc.updated_at = datetime.utcnow().replace(tzinfo=timezone.utc)
+    def update(
+        self,
+        doc: Union[BaseModel, dict],
+        owner: Optional[str] = None,
+        force: Optional[bool] = False,
+        dry_run: Optional[bool] = False,
+        check_restrictions: Optional[bool] = True,
+        validate: Optional[bool] = True,
+    ) -> None:
+        doc = self._prepare_doc(
+            doc=doc, owner=owner, force=force, is_update=True, validate=validate
+        )
 
-        if self.requires_owner_update:
-            if not force and (owner is None and self.force_ownership):
-                raise ValueError(
-                    f"An `owner` must be defined for collection {self.name}"
-                )
-            doc.updated_by = owner
+        # Check for any restrictions
+        if check_restrictions:
+            self._check_restrictions(doc=doc, is_update=True)
+
+        self._invalidate_probes(doc)
 
         # Convert from schema to dictionary
         doc_id = doc.id
@@ -322,14 +781,22 @@ class Collection(Generic[T]):
         if dry_run:
             return doc
 
+        if self.is_updatable:
+            # Let the server stamp the update time to avoid
+            # clock skew and payload bytes for the timestamp
+            doc["updated_at"] = SERVER_TIMESTAMP
+
         # Get document reference
         doc_ref = self.collection.document(doc_id)
 
-        # The `merge` mergeds the new data with any existing document
-        # to avoid overwriting entire documents.
-        # TODO: Use `doc_ref.update(...)` instead
+        # `update` sends only the provided field paths instead of a
+        # full-document merge and fails if the document is missing —
+        # which is what updating a non-existing document should do.
         # See https://googleapis.dev/python/firestore/latest/document.html?highlight=update#google.cloud.firestore_v1.document.DocumentReference.update
-        doc_ref.set(doc, merge=True)
+        doc_ref.update(doc)
+
+        if self._cache is not None:
+            self._cache.pop(doc_id)
 
     def update_attribute(
         self,
@@ -361,10 +828,10 @@ class Collection(Generic[T]):
         # Check for any restrictions
         self._check_restrictions_attributes(doc_id=doc_id, attributes=attributes)
 
-        # Set updated date
+        # Set updated date using the server-side timestamp
         doc = attributes
         if self.is_updatable:
-            doc["updated_at"] = datetime.utcnow().replace(tzinfo=timezone.utc)
+            doc["updated_at"] = SERVER_TIMESTAMP
 
         if self.requires_owner_update:
             if not force and (owner is None and self.force_ownership):
@@ -383,52 +850,69 @@ class Collection(Generic[T]):
         # https://googleapis.dev/python/firestore/latest/document.html?highlight=update#google.cloud.firestore_v1.document.DocumentReference.update
         doc_ref.update(doc)
 
+        if self._cache is not None:
+            self._cache.pop(doc_id)
+
     def bulk_update(
         self,
         docs: List[Union[BaseModel, dict]],
         owner: Optional[str] = None,
         force: Optional[bool] = False,
         merge: Optional[bool] = False,
-        batch_size: Optional[int] = 300,
+        batch_size: Optional[int] = 500,
+        max_parallel_batches: Optional[int] = 4,
     ) -> None:
         if batch_size <= 0:
             raise ValueError("`batch_size` must be larger than 0")
+        if batch_size > 500:
+            # Firestore limits a single batched write to 500 operations
+            raise ValueError("`batch_size` cannot exceed 500")
         if len(docs) == 0:
             raise ValueError("No documents provided")
 
-        # Parse all docs to dicts
+        if self._cache is not None:
+            self._cache.clear()
+        if self._probe_cache is not None:
+            self._probe_cache.clear()
+
+        # Check restrictions for all docs using batched queries
+        self._check_restrictions_bulk(docs=docs, is_update=True)
+
+        # Parse all docs to dicts without going through `update`
         docs = [
-            self.update(
-                doc=doc,
-                owner=owner,
-                force=force,
-                dry_run=True,
+            parse_document_to_dict(
+                doc=self._prepare_doc(doc=doc, owner=owner, force=force, is_update=True)
             )
             for doc in docs
         ]
 
-        # Define batch operation
-        write_batch = WriteBatch(client=self._client)
+        # Bind the document factory once outside the hot loop
+        document = self.collection.document
 
-        for i, doc in enumerate(docs):
-            doc_id = doc.pop("id", None)
-            if doc_id is None:
-                doc_id = str(ObjectId())
+        # Commit batches from a small thread pool so the next batch is
+        # built while earlier commits are still in flight
+        with ThreadPoolExecutor(max_workers=max_parallel_batches) as executor:
+            futures = []
 
-            write_batch.set(
-                reference=self.collection.document(doc_id),
-                document_data=doc,
-                merge=merge,
-            )
+            for docs_chunk in chunks(docs, n=batch_size):
+                write_batch = self._client.batch()
+                for doc in docs_chunk:
+                    doc_id = doc.pop("id", None)
+                    if doc_id is None:
+                        doc_id = str(ObjectId())
+
+                    write_batch.set(
+                        reference=document(doc_id),
+                        document_data=doc,
+                        merge=merge,
+                    )
 
-            if (i + 1) % batch_size == 0:
                 # Execute batch operation
-                write_batch.commit()
-                write_batch = WriteBatch(client=self._client)
+                futures.append(executor.submit(_commit_with_retry, write_batch))
 
-        if (i + 1) % batch_size != 0:
-            # Execute batch operation
-            write_batch.commit()
+            # Surface the first commit failure to the caller
+            for future in futures:
+                future.result()
 
     def insert(
         self,
@@ -436,115 +920,140 @@ class Collection(Generic[T]):
         owner: Optional[str] = None,
         force: Optional[bool] = False,
         dry_run: Optional[bool] = False,
+        check_restrictions: Optional[bool] = True,
+        validate: Optional[bool] = True,
     ) -> T:
-        if isinstance(doc, BaseModel) and not isinstance(doc, self.schema):
-            raise ValueError(f"Invalid schema used for provided document: {doc}")
-
-        if isinstance(doc, dict):
-            doc = self.schema(doc)
-
-        # Set created date
-        doc.created_at = datetime.utcnow().replace(tzinfo=timezone.utc)
-
-        if self.requires_owner_insert:
-            if not force and (owner is None and self.force_ownership):
-                raise ValueError(
-                    f"An `owner` must be defined for collection {self.name}"
-                )
-            doc.created_by = owner
+        model = self._prepare_doc(
+            doc=doc, owner=owner, force=force, is_update=False, validate=validate
+        )
 
         # Check for any restrictions
-        self._check_restrictions(doc=doc, is_update=False)
+        if check_restrictions:
+            self._check_restrictions(doc=model, is_update=False)
+
+        self._invalidate_probes(model)
 
         # Convert from schema to dictionary
-        doc = parse_document_to_dict(doc=doc)
+        doc = parse_document_to_dict(doc=model)
 
         if dry_run:
             return doc
 
+        # Let the server stamp the creation time; the returned object
+        # keeps the client timestamp since the sentinel is not a
+        # valid schema value
+        doc["created_at"] = SERVER_TIMESTAMP
+
         # Insert new document
         new_id = doc.pop("id", None)
         if new_id is None:
             new_id = str(ObjectId())
         doc_ref = self.collection.document(new_id)
-        doc_ref.create(doc)
-        doc = doc_ref.get()
+        try:
+            doc_ref.create(doc)
+        except AlreadyExists:
+            raise Conflict(
+                f"Document {self.collection_name}.{new_id} already exists"
+            )
 
-        return self.schema(**{**doc.to_dict(), "id": doc.id})
+        # The inserted document is already validated and in memory
+        # so return a copy of it instead of re-reading and
+        # re-parsing the written payload
+        return model.copy(update={"id": new_id})
 
     def bulk_insert(
         self,
         docs: List[Union[BaseModel, dict]],
         owner: Optional[str] = None,
         force: Optional[bool] = False,
-        batch_size: Optional[int] = 300,
+        batch_size: Optional[int] = 500,
+        max_parallel_batches: Optional[int] = 4,
     ) -> None:
         if batch_size <= 0:
             raise ValueError("`batch_size` must be larger than 0")
+        if batch_size > 500:
+            # Firestore limits a single batched write to 500 operations
+            raise ValueError("`batch_size` cannot exceed 500")
         if len(docs) == 0:
             raise ValueError("No documents provided")
 
-        # Parse all docs to dicts
+        # Check restrictions for all docs using batched queries
+        self._check_restrictions_bulk(docs=docs, is_update=False)
+
+        # Parse all docs to dicts without going through `insert`
         docs = [
-            self.insert(
-                doc=doc,
-                owner=owner,
-                force=force,
-                dry_run=True,
+            parse_document_to_dict(
+                doc=self._prepare_doc(doc=doc, owner=owner, force=force)
             )
             for doc in docs
         ]
 
-        # Define batch operation
-        write_batch = WriteBatch(client=self._client)
+        # Bind the document factory once outside the hot loop
+        document = self.collection.document
 
-        for i, doc in enumerate(docs):
-            doc_id = doc.pop("id", None)
-            if doc_id is None:
-                doc_id = str(ObjectId())
+        # Commit batches from a small thread pool so the next batch is
+        # built while earlier commits are still in flight
+        with ThreadPoolExecutor(max_workers=max_parallel_batches) as executor:
+            futures = []
 
-            write_batch.create(
-                reference=self.collection.document(doc_id), document_data=doc
-            )
+            for docs_chunk in chunks(docs, n=batch_size):
+                write_batch = self._client.batch()
+                for doc in docs_chunk:
+                    doc_id = doc.pop("id", None)
+                    if doc_id is None:
+                        doc_id = str(ObjectId())
+
+                    write_batch.create(reference=document(doc_id), document_data=doc)
 
-            if (i + 1) % batch_size == 0:
                 # Execute batch operation
-                write_batch.commit()
-                write_batch = WriteBatch(client=self._client)
+                futures.append(executor.submit(_commit_with_retry, write_batch))
 
-        if (i + 1) % batch_size != 0:
-            # Execute batch operation
-            write_batch.commit()
+            # Surface the first commit failure to the caller
+            for future in futures:
+                future.result()
 
     def delete(
         self, id: str, owner: Optional[str] = None, force: Optional[bool] = False
     ) -> None:
+        if self._cache is not None:
+            self._cache.pop(id)
+        if self._probe_cache is not None:
+            # The deleted values are unknown here — drop everything
+            self._probe_cache.clear()
+
         # Set updated by and time before deleting to trigger change
-        if issubclass(self.schema, SchemaWithOwner):
+        if self._is_owner_schema:
             if not force and (owner is None and self.force_ownership):
                 raise ValueError(
                     f"An `owner` must be defined for collection {self.name}"
                 )
 
             if owner is not None:
+                # Commit the tombstone and the delete as a single
+                # batched write instead of two round-trips
+                doc_ref = self.collection.document(id)
+                write_batch = self._client.batch()
                 if self.is_updatable:
-                    self.collection.document(id).set(
-                        {
-                            "updated_at": datetime.utcnow().replace(
-                                tzinfo=timezone.utc
-                            ),
+                    write_batch.set(
+                        reference=doc_ref,
+                        document_data={
+                            "updated_at": SERVER_TIMESTAMP,
                             "updated_by": owner,
                             "deleted": True,
                         },
                         merge=True,
                     )
                 else:
-                    self.collection.document(id).set(
-                        {
+                    write_batch.set(
+                        reference=doc_ref,
+                        document_data={
                             "deleted": True,
                         },
                         merge=True,
                     )
+                write_batch.delete(reference=doc_ref)
+                write_batch.commit()
+                return
 
         self.collection.document(id).delete()
 
@@ -553,16 +1062,25 @@ class Collection(Generic[T]):
         doc_ids: List[str],
         owner: Optional[str] = None,
         force: Optional[bool] = False,
-        batch_size: Optional[int] = 300,
+        batch_size: Optional[int] = 500,
+        max_parallel_batches: Optional[int] = 4,
     ) -> None:
         if batch_size <= 0:
             raise ValueError("`batch_size` must be larger than 0")
+        if batch_size > 500:
+            # Firestore limits a single batched write to 500 operations
+            raise ValueError("`batch_size` cannot exceed 500")
         if len(doc_ids) == 0:
             raise ValueError("No document IDs provided")
 
+        if self._cache is not None:
+            self._cache.clear()
+        if self._probe_cache is not None:
+            self._probe_cache.clear()
+
         # Set updated by and time before deleting to trigger change
         update_before_delete = False
-        if issubclass(self.schema, SchemaWithOwner):
+        if self._is_owner_schema:
             if not force and (owner is None and self.force_ownership):
                 raise ValueError(
                     f"An `owner` must be defined for collection {self.name}"
@@ -571,61 +1089,148 @@ class Collection(Generic[T]):
             if owner is not None:
                 update_before_delete = True
 
-        # Define batch operation
-        write_batch = WriteBatch(client=self._client)
-
         if update_before_delete:
             batch_size = max(1, batch_size // 2)
 
-        for i, doc_id in enumerate(doc_ids):
-            if update_before_delete:
-                if self.is_updatable:
-                    write_batch.set(
-                        reference=self.collection.document(doc_id),
-                        document_data={
-                            "updated_at": datetime.utcnow().replace(
-                                tzinfo=timezone.utc
-                            ),
-                            "updated_by": owner,
-                            "deleted": True,
-                        },
-                        merge=True,
-                    )
-                else:
-                    write_batch.set(
-                        reference=self.collection.document(doc_id),
-                        document_data={
-                            "deleted": True,
-                        },
-                        merge=True,
-                    )
-
-            write_batch.delete(reference=self.collection.document(doc_id))
+        # Bind the document factory once outside the hot loop
+        document = self.collection.document
+
+        # Commit batches from a small thread pool so the next batch is
+        # built while earlier commits are still in flight
+        with ThreadPoolExecutor(max_workers=max_parallel_batches) as executor:
+            futures = []
+
+            for ids_chunk in chunks(doc_ids, n=batch_size):
+                write_batch = self._client.batch()
+                # One timestamp per batch is enough — reading the
+                # clock per document only adds noise at this scale
+                if update_before_delete:
+                    now = datetime.now(timezone.utc)
+                for doc_id in ids_chunk:
+                    doc_ref = document(doc_id)
+                    if update_before_delete:
+                        if self.is_updatable:
+                            write_batch.set(
+                                reference=doc_ref,
+                                document_data={
+                                    "updated_at": now,
+                                    "updated_by": owner,
+                                    "deleted": True,
+                                },
+                                merge=True,
+                            )
+                        else:
+                            write_batch.set(
+                                reference=doc_ref,
+                                document_data={
+                                    "deleted": True,
+                                },
+                                merge=True,
+                            )
+
+                    write_batch.delete(reference=doc_ref)
 
-            if (i + 1) % batch_size == 0:
                 # Execute batch operation
-                write_batch.commit()
-                write_batch = WriteBatch(client=self._client)
-
-        if (i + 1) % batch_size != 0:
-            # Execute batch operation
-            write_batch.commit()
+                futures.append(executor.submit(_commit_with_retry, write_batch))
+
+            # Surface the first commit failure to the caller
+            for future in futures:
+                future.result()
+
+    def _probe_unique(self, key: str, value: Any) -> Optional[str]:
+        # Cheapest possible existence probe: at most one result and
+        # only the document name on the wire — no field payload to
+        # unmarshal and no schema object to build
+        if self._probe_cache is not None:
+            existing_id = self._probe_cache.get((key, value))
+            if existing_id is not None:
+                return existing_id
+
+        docs = (
+            self.collection.where(filter=FieldFilter(key, "==", value))
+            .limit(1)
+            .select(["__name__"])
+            .stream()
+        )
+        doc = next(docs, None)
+        if doc is None:
+            return None
+
+        if self._probe_cache is not None:
+            self._probe_cache.set((key, value), doc.id)
+        return doc.id
+
+    def _invalidate_probes(self, doc: BaseModel) -> None:
+        # Drop cached probe hits for the document being written so a
+        # changed unique value is re-checked against the server
+        if self._probe_cache is None:
+            return
+        doc_id = getattr(doc, "id", None)
+        for key in self._meta.unique_keys:
+            cache_key = (key, getattr(doc, key, None))
+            if doc_id is not None and self._probe_cache.get(cache_key) == doc_id:
+                # The cached probe points at this very document, which
+                # still holds the value after the write — keep it
+                continue
+            self._probe_cache.pop(cache_key)
 
     def _check_restrictions(self, doc: BaseModel, is_update: bool = False):
         # Check for any restrictions
         for key in self.get_unique_keys():
             value = getattr(doc, key)
-            try:
-                doc_db = self.get_by_attribute(key, value)
+            if value is None:
+                # Unset unique keys cannot clash
+                continue
 
-                # If the clashing document is itself the allow clash
-                if is_update and doc.id == doc_db.id:
-                    continue
+            existing_id = self._probe_unique(key=key, value=value)
 
-                raise Conflict(f"{self.name} with {key} {value} already exists")
-            except NotFound:
+            if existing_id is None:
                 # No document with given unique key found
-                pass
+                continue
+
+            # If the clashing document is itself then allow clash
+            if is_update and doc.id == existing_id:
+                continue
+
+            raise Conflict(f"{self.name} with {key} {value} already exists")
+
+    def _check_restrictions_bulk(
+        self,
+        docs: List[Union[BaseModel, dict]],
+        is_update: bool = False,
+    ):
+        # Check restrictions for all documents at once using `in`
+        # queries instead of issuing one query per document
+        for key in self.get_unique_keys():
+            doc_ids = {}
+            for doc in docs:
+                if isinstance(doc, dict):
+                    value = doc.get(key)
+                    doc_id = doc.get("id")
+                else:
+                    value = getattr(doc, key)
+                    doc_id = doc.id
+
+                if value is None:
+                    # Unset unique keys cannot clash
+                    continue
+
+                doc_ids[value] = doc_id
+
+            # Dedupe values while preserving order
+            values = list(doc_ids.keys())
+
+            # `_query_in` supports at most 100 chunks of 10 values
+            # so query in groups of max 1000 values
+            for values_chunk in chunks(values, n=1000):
+                for doc_db in self._query_in(attribute=key, values=values_chunk):
+                    value = getattr(doc_db, key)
+
+                    # If the clashing document is itself then allow clash
+                    if is_update and doc_ids.get(value) == doc_db.id:
+                        continue
+
+                    raise Conflict(f"{self.name} with {key} {value} already exists")
 
     def _check_restrictions_attributes(self, doc_id: str, attributes: Dict[str, Any]):
         # Check for any restrictions
@@ -633,44 +1238,42 @@ class Collection(Generic[T]):
             if key not in attributes:
                 continue
             value = attributes.get(key)
-            try:
-                doc_db = self.get_by_attribute(key, value)
-
-                # If the clashing document is itself then allow clash
-                if doc_id == doc_db.id:
-                    continue
+            docs_db = self.query_by_attribute(attribute=key, value=value, limit=1)
 
-                raise Conflict(f"{self.name} with {key} {value} already exists")
-            except NotFound:
+            if len(docs_db) == 0:
                 # No document with given unique key found
-                pass
+                continue
+
+            # If the clashing document is itself then allow clash
+            if doc_id == docs_db[0].id:
+                continue
+
+            raise Conflict(f"{self.name} with {key} {value} already exists")
 
     def _parse_conditions(
         self, conditions: List[Tuple[str, str, Any]]
     ) -> List[Tuple[str, str, Any]]:
-        conditions = list(conditions)
         conditions_parsed = []
-        if self.schema_props is not None:
+        if conditions and self.schema_props is not None:
+            datetime_attrs = self._meta.datetime_attrs
             for attribute, operator, value in conditions:
                 if not self.has_attribute(attribute):
                     raise KeyError(f"Invalid attribute provided: `{attribute}`")
 
-                attr_props = self.schema_props.get(attribute, {})
-                any_of = attr_props.get("anyOf", [])
-
                 # Check if schema is a datetime
-                if any((x.get("format") == "date-time" for x in any_of)):
-                    if type(value) == str:
-                        try:
-                            value = DatetimeWithNanoseconds.fromisoformat(value)
-                        except ValueError:
-                            pass
+                if attribute in datetime_attrs and type(value) == str:
+                    try:
+                        value = DatetimeWithNanoseconds.fromisoformat(value)
+                    except ValueError:
+                        pass
                 conditions_parsed.append((attribute, operator, value))
         return conditions_parsed
 
     def _parse_order_by(
-        self, order_by: Optional[List[Tuple[str, OrderByDirection]]] = []
+        self, order_by: Optional[List[Tuple[str, OrderByDirection]]] = None
     ) -> List[Tuple[str, OrderByDirection]]:
+        if not order_by:
+            return ()
         for attribute, order_by_direction in order_by:
             if not self.has_attribute(attribute):
                 raise KeyError(f"Invalid attribute provided: `{attribute}`")
@@ -1,20 +1,114 @@
+import time
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel, SecretStr
 
 
+class TTLCache:
+    # Simple in-process cache with a bounded size and an optional
+    # per-entry time-to-live. Entries are evicted oldest-first.
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at is not None and expires_at < time.monotonic():
+            self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        if key in self._data:
+            self._data.pop(key)
+        elif len(self._data) >= self.maxsize:
+            # Drop the oldest entry
+            self._data.popitem(last=False)
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self._data[key] = (expires_at, value)
+
+    def pop(self, key: Any) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
 def chunks(lst: List[Any], n: int) -> List[List[Any]]:
-    for i in range(0, len(lst), n):
-        yield lst[i:i + n]
+    # A plain list of slices — callers either iterate it or need its
+    # length anyway, so a generator only adds a frame per chunk
+    return [lst[i:i + n] for i in range(0, len(lst), n)]
+
+
+@lru_cache(maxsize=None)
+def _coercion_fields(
+    schema_cls: type,
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    # Determine once per schema class which fields hold secret or
+    # enum values so serialization does not have to type-check
+    # every field on every call. Fields whose type cannot be pinned
+    # down (e.g. `Any`) fall back to per-value isinstance checks.
+    secret_fields = []
+    enum_fields = []
+    dynamic_fields = []
+    for key, field in schema_cls.__fields__.items():
+        # Unions are represented through `sub_fields`; classify the
+        # field by its members so e.g. `Union[str, Color]` is still
+        # coerced
+        if field.sub_fields:
+            candidates = [sub.type_ for sub in field.sub_fields]
+        else:
+            candidates = [field.type_]
+        try:
+            if any(type_ is Any for type_ in candidates):
+                # `Any` passes issubclass checks on newer Pythons but
+                # tells us nothing about the values
+                raise TypeError
+            if any(issubclass(type_, SecretStr) for type_ in candidates):
+                secret_fields.append(key)
+            elif any(issubclass(type_, Enum) for type_ in candidates):
+                enum_fields.append(key)
+        except TypeError:
+            # Type cannot be pinned down to a plain class — the field
+            # may hold anything, so check its values at serialization
+            # time
+            dynamic_fields.append(key)
+    return tuple(secret_fields), tuple(enum_fields), tuple(dynamic_fields)
 
 
 def parse_document_to_dict(doc: BaseModel) -> Dict[str, Any]:
+    secret_fields, enum_fields, dynamic_fields = _coercion_fields(doc.__class__)
+
     # Convert to dictionary
     doc = doc.dict()
 
-    # Check for any secret values and enum values
-    for key, value in doc.items():
+    # Check for any secret values and enum values. The fields are
+    # known to hold these types so no per-value isinstance checks are
+    # needed; the except covers models built with `construct`, whose
+    # fields may already hold plain values.
+    for key in secret_fields:
+        value = doc.get(key)
+        if value is not None:
+            try:
+                doc[key] = value.get_secret_value()
+            except AttributeError:
+                pass
+    for key in enum_fields:
+        value = doc.get(key)
+        if value is not None:
+            try:
+                doc[key] = value.value
+            except AttributeError:
+                pass
+    for key in dynamic_fields:
+        value = doc.get(key)
         if isinstance(value, SecretStr):
             doc[key] = value.get_secret_value()
         elif isinstance(value, Enum):
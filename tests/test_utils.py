@@ -0,0 +1,98 @@
+import enum
+import time
+import unittest
+from typing import Any, Optional, Union
+
+from pydantic import BaseModel, SecretStr
+
+from firestore_collections.utils import TTLCache, chunks, parse_document_to_dict
+
+
+class Color(enum.Enum):
+    Red = 'red'
+    Blue = 'blue'
+
+
+class Document(BaseModel):
+    name: str
+    password: Optional[SecretStr]
+    color: Optional[Color]
+
+
+class TestParseDocumentToDict(unittest.TestCase):
+    def test_coerces_secret_and_enum_values(self):
+        doc = Document(name='John', password='hunter2', color=Color.Red)
+        parsed = parse_document_to_dict(doc=doc)
+        self.assertEqual(parsed['name'], 'John')
+        self.assertEqual(parsed['password'], 'hunter2')
+        self.assertEqual(parsed['color'], 'red')
+
+    def test_none_values_are_kept(self):
+        doc = Document(name='John')
+        parsed = parse_document_to_dict(doc=doc)
+        self.assertIsNone(parsed['password'])
+        self.assertIsNone(parsed['color'])
+
+    def test_coerces_union_and_any_fields(self):
+        class UnionDocument(BaseModel):
+            color: Union[Color, str]
+            extra: Any
+
+        doc = UnionDocument(color=Color.Blue, extra=Color.Red)
+        parsed = parse_document_to_dict(doc=doc)
+        self.assertEqual(parsed['color'], 'blue')
+        self.assertEqual(parsed['extra'], 'red')
+
+        doc = UnionDocument(color='not-a-color', extra='plain')
+        parsed = parse_document_to_dict(doc=doc)
+        self.assertEqual(parsed['color'], 'not-a-color')
+        self.assertEqual(parsed['extra'], 'plain')
+
+
+class TestChunks(unittest.TestCase):
+    def test_chunks(self):
+        values = list(range(25))
+        values_lists = list(chunks(values, n=10))
+        self.assertEqual(len(values_lists), 3)
+        self.assertEqual(values_lists[0], list(range(10)))
+        self.assertEqual(values_lists[-1], [20, 21, 22, 23, 24])
+
+    def test_chunks_empty(self):
+        self.assertEqual(list(chunks([], n=10)), [])
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_get_and_set(self):
+        cache = TTLCache(maxsize=2)
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+
+    def test_maxsize_evicts_oldest(self):
+        cache = TTLCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), 2)
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_ttl_expires(self):
+        cache = TTLCache(maxsize=2, ttl=0.01)
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('a'))
+
+    def test_pop_and_clear(self):
+        cache = TTLCache(maxsize=2)
+        cache.set('a', 1)
+        cache.pop('a')
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', 1)
+        cache.clear()
+        self.assertIsNone(cache.get('a'))
+
+
+if __name__ == '__main__':
+    unittest.main()